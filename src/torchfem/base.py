@@ -32,6 +32,9 @@ class FEM(ABC):
         idx = (self.n_dim * self.elements).unsqueeze(-1) + torch.arange(self.n_dim)
         self.idx = idx.reshape(self.n_elem, -1).to(torch.int32)
 
+        # Cached stiffness sparsity pattern (elements, constrained dofs, pattern)
+        self._pattern = None
+
         # Vectorize material
         if material.is_vectorized:
             self.material = material
@@ -83,6 +86,21 @@ class FEM(ABC):
             raise TypeError("Constraints must be a boolean tensor.")
         self._constraints = value.to(self.nodes.device)
 
+    @property
+    def etype(self) -> Element:
+        return self._etype
+
+    @etype.setter
+    def etype(self, value: Element):
+        self._etype = value
+
+        # Cache integration points, weights and shape functions evaluated there
+        self._xi = value.ipoints()
+        self._w = value.iweights()
+        self._N = value.N(self._xi)
+        self._B = value.B(self._xi)
+        self.n_int = len(self._w)
+
     @abstractmethod
     def D(self, B: Tensor, nodes: Tensor) -> Tensor:
         raise NotImplementedError
@@ -137,9 +155,9 @@ class FEM(ABC):
         de0: Tensor,
     ) -> Tuple[Tensor, Tensor]:
         """Perform numerical integrations for element stiffness matrix."""
-        # Reshape variables
+        # Gather element nodes and dofs
         nodes = self.nodes[self.elements, :]
-        du = du.reshape((-1, self.n_dim))[self.elements, :].reshape(self.n_elem, -1)
+        du = du.ravel()[self.idx]
 
         # Initialize nodal force and stiffness
         N_nod = self.etype.nodes
@@ -149,19 +167,21 @@ class FEM(ABC):
         else:
             k = torch.empty(0)
 
-        for i, (w, xi) in enumerate(zip(self.etype.iweights(), self.etype.ipoints())):
-            # Compute gradient operators
-            b = self.etype.B(xi)
-            if b.shape[0] == 1:
-                dx = nodes[:, 1] - nodes[:, 0]
-                J = 0.5 * torch.linalg.norm(dx, dim=1)[:, None, None]
-            else:
-                J = torch.einsum("jk,mkl->mjl", b, nodes)
-            detJ = torch.linalg.det(J)
-            if torch.any(detJ <= 0.0):
-                raise Exception("Negative Jacobian. Check element numbering.")
-            B = torch.einsum("jkl,lm->jkm", torch.linalg.inv(J), b)
-            D = self.D(B, nodes)
+        # Compute gradient operators at all integration points at once
+        b = self._B
+        if b.shape[-2] == 1:
+            dx = nodes[:, 1] - nodes[:, 0]
+            J = 0.5 * torch.linalg.norm(dx, dim=1)[None, :, None, None]
+            J = J.expand(self.n_int, -1, -1, -1)
+        else:
+            J = torch.einsum("ijk,mkl->imjl", b, nodes)
+        detJ = torch.linalg.det(J)
+        if torch.any(detJ <= 0.0):
+            raise Exception("Negative Jacobian. Check element numbering.")
+        B = torch.einsum("ijkl,ilm->ijkm", torch.linalg.inv(J), b)
+
+        for i, w in enumerate(self._w):
+            D = self.D(B[i], nodes)
 
             # Evaluate material response
             de = torch.einsum("jkl,jl->jk", D, du) - de0
@@ -170,12 +190,12 @@ class FEM(ABC):
             )
 
             # Compute element internal forces
-            f += w * self.compute_f(detJ, D, sig[n, i].clone())
+            f += w * self.compute_f(detJ[i], D, sig[n, i].clone())
 
             # Compute element stiffness matrix
             if self.K.numel() == 0 or not self.material.n_state == 0:
-                DCD = torch.einsum("jkl,jlm,jkn->jmn", ddsdde, D, D)
-                k += w * self.compute_k(detJ, DCD)
+                DCD = (ddsdde @ D).transpose(-1, -2) @ D
+                k += w * self.compute_k(detJ[i], DCD)
 
         return k, f
 
@@ -186,52 +206,120 @@ class FEM(ABC):
         if field is None:
             field = torch.ones(self.n_nod)
 
-        # Integrate
+        # Integrate at all integration points at once
         nodes = self.nodes[self.elements, :]
-        res = torch.zeros(len(self.elements))
-        for w, xi in zip(self.etype.iweights(), self.etype.ipoints()):
-            N = self.etype.N(xi)
-            B = self.etype.B(xi)
-            J = torch.einsum("jk,mkl->mjl", B, nodes)
-            detJ = torch.linalg.det(J)
-            f = field[self.elements, None].squeeze() @ N
-            res += w * f * detJ
-        return res
-
-    def assemble_stiffness(self, k: Tensor, con: Tensor) -> torch.sparse.Tensor:
+        J = torch.einsum("ijk,mkl->imjl", self._B, nodes)
+        detJ = torch.linalg.det(J)
+        f = torch.einsum("mk,ik->im", field[self.elements], self._N)
+        return torch.einsum("i,im,im->m", self._w, f, detJ)
+
+    def stiffness_pattern(
+        self, con: Tensor, chunks: int = 4
+    ) -> Tuple[list[Tensor], Tensor, Tensor]:
+        """Compute sparsity pattern of global stiffness matrix."""
+
+        d = self.n_dim
+        n_nod = self.n_nod
+        elements = self.elements.to(torch.int64)
+        device = elements.device
+
+        # Unique node pairs (including all diagonal pairs) sorted by row node
+        pairs = (elements.unsqueeze(-1) * n_nod + elements.unsqueeze(1)).ravel()
+        diagonal = torch.arange(n_nod, device=device) * (n_nod + 1)
+        pairs, inverse = torch.unique(torch.cat((pairs, diagonal)), return_inverse=True)
+        inverse = inverse[: -len(diagonal)].reshape(elements.shape + elements.shape[1:])
+
+        # Dof indices and pattern positions fit into int32 for most meshes
+        dtype = torch.int32 if d * d * len(pairs) < 2**31 - 1 else torch.int64
+        row_node = (pairs // n_nod).to(dtype)
+        col_node = (pairs % n_nod).to(dtype)
+
+        # Each node pair expands to a d x d block of dofs. A row node with m
+        # neighbours thus owns d consecutive rows of m * d (sorted) entries each.
+        count = torch.bincount(row_node, minlength=n_nod).to(dtype)
+        start = torch.cumsum(count, 0, dtype=dtype) - count
+        rank = torch.arange(len(pairs), dtype=dtype, device=device) - start[row_node]
+
+        def position(a, i, r, j):
+            return d * d * start[a] + i * d * count[a] + d * r + j
+
+        # Row and column indices of the full dof pattern
+        ij = torch.arange(d, dtype=dtype, device=device)
+        a = row_node.view(-1, 1, 1)
+        b = col_node.view(-1, 1, 1)
+        i = ij.view(1, d, 1)
+        j = ij.view(1, 1, d)
+        full = position(a, i, rank.view(-1, 1, 1), j).ravel()
+        rows = torch.empty_like(full)
+        cols = torch.empty_like(full)
+        rows[full] = (d * a + i).expand(-1, d, d).ravel()
+        cols[full] = (d * b + j).expand(-1, d, d).ravel()
+
+        # Eliminate constrained dofs (except their diagonal)
+        constrained = torch.zeros(self.n_dofs, dtype=torch.bool, device=device)
+        constrained[con] = True
+        on_diagonal = rows == cols
+        keep = ~(constrained[rows] | constrained[cols]) | on_diagonal
+        new = torch.cumsum(keep, 0, dtype=dtype) - 1
+        new[~keep] = keep.sum().to(dtype)
+        diagonal = new[constrained[rows] & on_diagonal]
+
+        # Map element entries to positions in the pattern (eliminated ones to the end)
+        i = ij.view(1, 1, d, 1, 1)
+        j = ij.view(1, 1, 1, 1, d)
+        inverses = []
+        for e, inv in zip(torch.chunk(elements, chunks), torch.chunk(inverse, chunks)):
+            a = e[:, :, None, None, None]
+            r = rank[inv][:, :, None, :, None]
+            inverses.append(new[position(a, i, r, j)].ravel())
+
+        indices = torch.stack((rows[keep], cols[keep]), dim=0).to(torch.int64)
+
+        return inverses, diagonal, indices
+
+    def _pattern_matches(self, con: Tensor) -> bool:
+        """Check if the cached sparsity pattern is valid for the current model."""
+        if self._pattern is None:
+            return False
+        elements, cached_con, _ = self._pattern
+        return (
+            elements.shape == self.elements.shape
+            and elements.device == self.elements.device
+            and cached_con.shape == con.shape
+            and cached_con.device == con.device
+            and torch.equal(elements, self.elements)
+            and torch.equal(cached_con, con)
+        )
+
+    def assemble_stiffness(
+        self,
+        k: Tensor,
+        con: Tensor,
+        pattern: Tuple[list[Tensor], Tensor, Tensor] | None = None,
+    ) -> torch.sparse.Tensor:
         """Assemble global stiffness matrix."""
 
-        # Initialize sparse matrix
         size = (self.n_dofs, self.n_dofs)
-        K = torch.empty(size, layout=torch.sparse_coo)
-
-        # Build matrix in chunks to prevent excessive memory usage
-        chunks = 4
-        for idx, k_chunk in zip(torch.chunk(self.idx, chunks), torch.chunk(k, chunks)):
-            # Ravel indices and values
-            chunk_size = idx.shape[0]
-            col = idx.unsqueeze(1).expand(chunk_size, self.idx.shape[1], -1).ravel()
-            row = idx.unsqueeze(-1).expand(chunk_size, -1, self.idx.shape[1]).ravel()
-            indices = torch.stack([row, col], dim=0)
-            values = k_chunk.ravel()
-
-            # Eliminate and replace constrained dofs
-            ci = torch.isin(idx, con)
-            mask_col = ci.unsqueeze(1).expand(chunk_size, self.idx.shape[1], -1).ravel()
-            mask_row = (
-                ci.unsqueeze(-1).expand(chunk_size, -1, self.idx.shape[1]).ravel()
-            )
-            mask = ~(mask_col | mask_row)
-            diag_index = torch.stack((con, con), dim=0)
-            diag_value = torch.ones_like(con, dtype=k.dtype)
 
-            # Concatenate
-            indices = torch.cat((indices[:, mask], diag_index), dim=1)
-            values = torch.cat((values[mask], diag_value), dim=0)
+        # Sparsity pattern depends only on mesh and constraints
+        if pattern is None:
+            pattern = self.stiffness_pattern(con)
+        inverses, diagonal, indices = pattern
+
+        # Scatter element values into the sparsity pattern
+        values = k.new_zeros(indices.shape[1] + 1)
+        k_chunks = torch.split(k.ravel(), [inverse.numel() for inverse in inverses])
+        for k_chunk, inverse in zip(k_chunks, inverses):
+            values.index_add_(0, inverse, k_chunk)
+        values = values[:-1]
 
-            K += torch.sparse_coo_tensor(indices, values, size=size).coalesce()
+        # Unit diagonal for constrained dofs
+        values[diagonal] = 1.0
 
-        return K.coalesce()
+        # Pattern is sorted and unique by construction
+        return torch.sparse_coo_tensor(
+            indices, values, size=size, is_coalesced=True, check_invariants=False
+        )
 
     def assemble_force(self, f: Tensor) -> Tensor:
         """Assemble global force vector."""
@@ -276,8 +364,13 @@ class FEM(ABC):
         f = torch.zeros(N, self.n_nod, self.n_dim)
         u = torch.zeros(N, self.n_nod, self.n_dim)
 
-        # Initialize global stiffness matrix
+        # Initialize global stiffness matrix and reuse sparsity pattern if the
+        # elements and constrained dofs did not change since the last solve
         self.K = torch.empty(0)
+        if not self._pattern_matches(con):
+            pattern = self.stiffness_pattern(con)
+            self._pattern = (self.elements.clone(), con, pattern)
+        pattern = self._pattern[2]
 
         # Initialize displacement increment
         du = torch.zeros_like(self.nodes).ravel()
@@ -301,7 +394,7 @@ class FEM(ABC):
 
                 # Assemble global stiffness matrix and internal force vector (if needed)
                 if self.K.numel() == 0 or not self.material.n_state == 0:
-                    self.K = self.assemble_stiffness(k, con)
+                    self.K = self.assemble_stiffness(k, con, pattern)
                 F_int = self.assemble_force(f_int)
 
                 # Compute residual
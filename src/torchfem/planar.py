@@ -1,6 +1,7 @@
 import matplotlib.pyplot as plt
+import numpy as np
 import torch
-from matplotlib.collections import PolyCollection
+from matplotlib.collections import LineCollection, PolyCollection
 from torch import Tensor
 
 from .base import FEM
@@ -31,27 +32,26 @@ class Planar(FEM):
 
         # Set element type specific sizes
         self.n_strains = 3
-        self.n_int = len(self.etype.iweights())
 
         # Initialize external strain
         self.ext_strain = torch.zeros(self.n_elem, self.n_strains)
 
     def D(self, B: Tensor, _):
         """Element gradient operator."""
-        zeros = torch.zeros(self.n_elem, self.etype.nodes)
-        shape = [self.n_elem, -1]
-        D0 = torch.stack([B[:, 0, :], zeros], dim=-1).reshape(shape)
-        D1 = torch.stack([zeros, B[:, 1, :]], dim=-1).reshape(shape)
-        D2 = torch.stack([B[:, 1, :], B[:, 0, :]], dim=-1).reshape(shape)
-        return torch.stack([D0, D1, D2], dim=1)
+        D = B.new_zeros(self.n_elem, 3, 2 * self.etype.nodes)
+        D[:, 0, 0::2] = B[:, 0, :]
+        D[:, 1, 1::2] = B[:, 1, :]
+        D[:, 2, 0::2] = B[:, 1, :]
+        D[:, 2, 1::2] = B[:, 0, :]
+        return D
 
     def compute_k(self, detJ: Tensor, DCD: Tensor):
         """Element stiffness matrix."""
-        return torch.einsum("j,j,jkl->jkl", self.thickness, detJ, DCD)
+        return (self.thickness * detJ)[:, None, None] * DCD
 
     def compute_f(self, detJ: Tensor, D: Tensor, S: Tensor):
         """Element internal force vector."""
-        return torch.einsum("j,j,jkl,jk->jl", self.thickness, detJ, D, S)
+        return (self.thickness * detJ)[:, None] * torch.einsum("jkl,jk->jl", D, S)
 
     @torch.no_grad()
     def plot(
@@ -88,10 +88,7 @@ class Planar(FEM):
         # Color surface with interpolated nodal properties (if provided)
         if node_property is not None:
             if isinstance(self.etype, (Quad1, Quad2)):
-                triangles = []
-                for e in self.elements:
-                    triangles.append([e[0], e[1], e[2]])
-                    triangles.append([e[2], e[3], e[0]])
+                triangles = self.elements[:, [0, 1, 2, 2, 3, 0]].reshape(-1, 3).tolist()
             else:
                 triangles = self.elements[:, :3].tolist()
             ax.tricontourf(
@@ -131,57 +128,64 @@ class Planar(FEM):
                     ax.annotate(str(i), (node[0] + 0.01, node[1] + 0.01), color=color)
 
         # Elements
-        for element in self.elements:
-            if isinstance(self.etype, Tria2):
-                element = element[:3]
-            if isinstance(self.etype, Quad2):
-                element = element[:4]
-            x1 = [pos[node, 0] for node in element] + [pos[element[0], 0]]
-            x2 = [pos[node, 1] for node in element] + [pos[element[0], 1]]
-            ax.plot(x1, x2, color=color, linewidth=linewidth)
+        if isinstance(self.etype, Tria2):
+            corners = self.elements[:, :3]
+        elif isinstance(self.etype, Quad2):
+            corners = self.elements[:, :4]
+        else:
+            corners = self.elements
+        outlines = pos[torch.cat([corners, corners[:, :1]], dim=1)]
+        ax.add_collection(
+            LineCollection(outlines.cpu().numpy(), colors=color, linewidths=linewidth)
+        )
 
         # Forces
         if bcs:
-            for i, force in enumerate(self.forces):
-                if torch.norm(force) > 0.0:
-                    x = float(pos[i][0])
-                    y = float(pos[i][1])
-                    ax.arrow(
-                        x,
-                        y,
-                        size * 0.05 * force[0] / torch.norm(force),
-                        size * 0.05 * force[1] / torch.norm(force),
-                        width=0.01 * size,
-                        facecolor="gray",
-                        linewidth=0.0,
-                        zorder=10,
-                    )
+            forces = self.forces.to(pos.device)
+            norm = torch.linalg.norm(forces, dim=1)
+            mask = norm > 0.0
+            if mask.any():
+                # Arrows in data units: shaft 0.05 * size, width 0.01 * size
+                width = 0.01 * size
+                length = 0.05 * size + 4.5 * width
+                tails = pos[mask].cpu().numpy()
+                arrows = (length * forces[mask] / norm[mask, None]).cpu().numpy()
+                ax.quiver(
+                    tails[:, 0],
+                    tails[:, 1],
+                    arrows[:, 0],
+                    arrows[:, 1],
+                    angles="xy",
+                    scale_units="xy",
+                    scale=1.0,
+                    units="xy",
+                    width=float(width),
+                    headwidth=3.0,
+                    headlength=4.5,
+                    headaxislength=4.5,
+                    color="gray",
+                    zorder=10,
+                )
+                ax.update_datalim(tails + arrows)
+                ax.autoscale_view()
 
         # Constraints
         if bcs:
-            for i, constraint in enumerate(self.constraints):
-                x = float(pos[i][0])
-                y = float(pos[i][1])
-                if constraint[0]:
-                    ax.plot(x - 0.01 * size, y, ">", color="gray")
-                if constraint[1]:
-                    ax.plot(x, y - 0.01 * size, "^", color="gray")
+            constraints = self.constraints.to(pos.device)
+            con_x = constraints[:, 0]
+            con_y = constraints[:, 1]
+            ax.plot(pos[con_x, 0] - 0.01 * size, pos[con_x, 1], ">", color="gray")
+            ax.plot(pos[con_y, 0], pos[con_y, 1] - 0.01 * size, "^", color="gray")
 
         # Material orientations
         if orientation is not None:
-            centers = pos[self.elements, :].mean(dim=1)
-            dir = torch.stack(
-                [
-                    torch.cos(orientation),
-                    -torch.sin(orientation),
-                    torch.zeros_like(orientation),
-                ]
-            ).T
+            centers = pos[self.elements, :].mean(dim=1).cpu().numpy()
+            phi = orientation.detach().cpu().numpy()
             ax.quiver(
                 centers[:, 0],
                 centers[:, 1],
-                dir[:, 0],
-                dir[:, 1],
+                np.cos(phi),
+                -np.sin(phi),
                 pivot="middle",
                 headlength=0,
                 headaxislength=0,
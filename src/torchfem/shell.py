@@ -40,16 +40,9 @@ class Shell:
         # Element type
         self.etype = Tria1()
 
-        # Compute mapping from local to global indices (hard to read, but fast)
-        N = self.n_elem
-        idx = ((NDOF * self.elements).unsqueeze(-1) + torch.arange(NDOF)).reshape(N, -1)
-        self.indices = torch.stack(
-            [
-                idx.unsqueeze(-1).expand(N, -1, idx.shape[1]),
-                idx.unsqueeze(1).expand(N, idx.shape[1], -1),
-            ],
-            dim=0,
-        )
+        # Compute mapping from local to global indices
+        idx = (NDOF * self.elements).unsqueeze(-1) + torch.arange(NDOF)
+        self.idx = idx.reshape(self.n_elem, -1)
 
     def _Dm(self, B):
         """Aggregate strain-displacement matrices
@@ -133,23 +126,22 @@ class Shell:
 
     def update_local_nodes(self):
         # Element type and local coordinates
-        local_coords = []
-        for element in self.elements:
-            edge1 = self.nodes[element[1]] - self.nodes[element[0]]
-            edge2 = self.nodes[element[2]] - self.nodes[element[1]]
+        def local_coords(element_nodes):
+            edge1 = element_nodes[1] - element_nodes[0]
+            edge2 = element_nodes[2] - element_nodes[1]
             normal = torch.linalg.cross(edge1, edge2)
             normal = normal / torch.linalg.norm(normal)
             dir1 = edge1 / torch.linalg.norm(edge1)
             dir2 = -torch.linalg.cross(edge1, normal)
             dir2 = dir2 / torch.linalg.norm(dir2)
-            local_coords.append(torch.vstack([dir1, dir2, normal]))
+            return torch.vstack([dir1, dir2, normal])
 
         # Tranformation matrix x = t X with element coords x and global coords X
-        self.t = torch.stack(local_coords)
+        nodes = self.nodes[self.elements, :]
+        self.t = torch.func.vmap(local_coords)(nodes)
         self.T = torch.func.vmap(torch.block_diag)(*(NDOF * [self.t]))
 
         # Compute local node coordinates
-        nodes = self.nodes[self.elements, :]
         rel_pos = (nodes - nodes[:, 0, None]).transpose(2, 1)
         self.loc_nodes = (self.t @ rel_pos).transpose(2, 1)[:, :, 0:2]
 
@@ -169,21 +161,21 @@ class Shell:
 
             # Element membrane stiffness
             Dm = self._Dm(B)
-            DmCDm = torch.einsum("...ji,...jk,...kl->...il", Dm, self.C, Dm)
-            km = torch.einsum("i,ijk->ijk", w * self.thickness * detJ, DmCDm)
+            DmCDm = Dm.transpose(-1, -2) @ self.C @ Dm
+            km = (w * self.thickness * detJ)[:, None, None] * DmCDm
 
             # Element bending stiffness
             Db = self._Db(B)
-            DbCDb = torch.einsum("...ji,...jk,...kl->...il", Db, self.C, Db)
-            kb = torch.einsum("i,ijk->ijk", w * self.thickness**3 * detJ / 12.0, DbCDb)
+            DbCDb = Db.transpose(-1, -2) @ self.C @ Db
+            kb = (w * self.thickness**3 * detJ / 12.0)[:, None, None] * DbCDb
 
             # Element transverse stiffness
             Ds = self._Ds(A)
             h = sqrt(2) * A
             alpha = KAPPA / (2 * (1 + NU))
             psi = KAPPA * self.thickness**2 / (self.thickness**2 + alpha * h**2)
-            DsCsDs = torch.einsum("...ji,...jk,...kl->...il", Ds, self.Cs, Ds)
-            ks = torch.einsum("i,ijk->ijk", w * A * psi * self.thickness * detJ, DsCsDs)
+            DsCsDs = Ds.transpose(-1, -2) @ self.Cs @ Ds
+            ks = (w * A * psi * self.thickness * detJ)[:, None, None] * DsCsDs
 
             # Element drilling stiffness
             kd = torch.zeros_like(km)
@@ -199,7 +191,10 @@ class Shell:
 
     def stiffness(self):
         # Assemble global stiffness matrix
-        indices = self.indices.reshape((2, -1))
+        N, n = self.idx.shape
+        row = self.idx.unsqueeze(-1).expand(N, -1, n).ravel()
+        col = self.idx.unsqueeze(1).expand(N, n, -1).ravel()
+        indices = torch.stack([row, col], dim=0)
         values = self.k().ravel()
         size = (self.n_dofs, self.n_dofs)
         return torch.sparse_coo_tensor(indices, values, size=size).coalesce()
@@ -220,8 +215,9 @@ class Shell:
         u = self.displacements.detach().ravel()
         u[uncon] = u_red
 
-        # Evaluate force
-        f = K @ u
+        # Evaluate force (reactions are only needed at constrained dofs)
+        f = self.forces.ravel().clone()
+        f[con] = sparse_index_select(K, [con, None]) @ u
 
         u = u.reshape((-1, NDOF))
         f = f.reshape((-1, NDOF))
@@ -229,7 +225,7 @@ class Shell:
 
     def compute_stress(self, u, xi=[0.0, 0.0], z=0, mises=False):
         # Extract displacement degrees of freedom
-        disp = u[self.elements, :].reshape(self.n_elem, -1)
+        disp = u.ravel()[self.idx]
 
         # Jacobian
         xi = torch.tensor(xi)
@@ -298,15 +294,14 @@ class Shell:
         pl.enable_anti_aliasing("ssaa")
 
         # VTK element list
-        elements = []
-        for element in self.elements:
-            elements += [len(element), *element]
+        el = len(self.elements[0]) * torch.ones(self.n_elem, dtype=self.elements.dtype)
+        elements = torch.cat([el[:, None], self.elements], dim=1).view(-1).cpu().numpy()
 
         # Deformed node positions
         pos = self.nodes + u
 
         # Create unstructured mesh
-        mesh = pyvista.PolyData(pos.tolist(), elements)
+        mesh = pyvista.PolyData(pos.cpu().numpy(), elements)
 
         # Plot node properties
         if node_property:
@@ -320,12 +315,12 @@ class Shell:
 
         # Plot as seperate top and bottom surface
         if thickness:
+            idx = self.elements.ravel().cpu().numpy()
+            elem_thickness = self.thickness.detach().cpu().numpy()
             nodal_thickness = np.zeros((len(self.nodes)))
             count = np.zeros((len(self.nodes)))
-            for i, face in enumerate(mesh.faces.reshape(-1, 4)):
-                idx = face[1::]
-                nodal_thickness[idx] += self.thickness[i].item()
-                count[idx] += 1
+            np.add.at(nodal_thickness, idx, np.repeat(elem_thickness, self.etype.nodes))
+            np.add.at(count, idx, 1)
             nodal_thickness /= count
 
             top = mesh.copy()
@@ -1,3 +1,4 @@
+import numpy as np
 import pyvista
 import torch
 from torch import Tensor
@@ -27,30 +28,31 @@ class Solid(FEM):
 
         # Set element type specific sizes
         self.n_strains = 6
-        self.n_int = len(self.etype.iweights())
 
         # Initialize external strain
         self.ext_strain = torch.zeros(self.n_elem, self.n_strains)
 
     def D(self, B: Tensor, nodes: Tensor) -> Tensor:
         """Element gradient operator"""
-        zeros = torch.zeros(self.n_elem, self.etype.nodes)
-        shape = [self.n_elem, -1]
-        D0 = torch.stack([B[:, 0, :], zeros, zeros], dim=-1).reshape(shape)
-        D1 = torch.stack([zeros, B[:, 1, :], zeros], dim=-1).reshape(shape)
-        D2 = torch.stack([zeros, zeros, B[:, 2, :]], dim=-1).reshape(shape)
-        D3 = torch.stack([zeros, B[:, 2, :], B[:, 1, :]], dim=-1).reshape(shape)
-        D4 = torch.stack([B[:, 2, :], zeros, B[:, 0, :]], dim=-1).reshape(shape)
-        D5 = torch.stack([B[:, 1, :], B[:, 0, :], zeros], dim=-1).reshape(shape)
-        return torch.stack([D0, D1, D2, D3, D4, D5], dim=1)
+        D = B.new_zeros(self.n_elem, 6, 3 * self.etype.nodes)
+        D[:, 0, 0::3] = B[:, 0, :]
+        D[:, 1, 1::3] = B[:, 1, :]
+        D[:, 2, 2::3] = B[:, 2, :]
+        D[:, 3, 1::3] = B[:, 2, :]
+        D[:, 3, 2::3] = B[:, 1, :]
+        D[:, 4, 0::3] = B[:, 2, :]
+        D[:, 4, 2::3] = B[:, 0, :]
+        D[:, 5, 0::3] = B[:, 1, :]
+        D[:, 5, 1::3] = B[:, 0, :]
+        return D
 
     def compute_k(self, detJ: Tensor, DCD: Tensor) -> Tensor:
         """Element stiffness matrix"""
-        return torch.einsum("j,jkl->jkl", detJ, DCD)
+        return detJ[:, None, None] * DCD
 
     def compute_f(self, detJ: Tensor, D: Tensor, S: Tensor) -> Tensor:
         """Element internal force vector."""
-        return torch.einsum("j,jkl,jk->jl", detJ, D, S)
+        return detJ[:, None] * torch.einsum("jkl,jk->jl", D, S)
 
     @torch.no_grad()
     def plot(
@@ -87,23 +89,24 @@ class Solid(FEM):
 
         # VTK cell types
         if isinstance(self.etype, Tetra1):
-            cell_types = self.n_elem * [pyvista.CellType.TETRA]
+            cell_type = pyvista.CellType.TETRA
         elif isinstance(self.etype, Tetra2):
-            cell_types = self.n_elem * [pyvista.CellType.QUADRATIC_TETRA]
+            cell_type = pyvista.CellType.QUADRATIC_TETRA
         elif isinstance(self.etype, Hexa1):
-            cell_types = self.n_elem * [pyvista.CellType.HEXAHEDRON]
+            cell_type = pyvista.CellType.HEXAHEDRON
         elif isinstance(self.etype, Hexa2):
-            cell_types = self.n_elem * [pyvista.CellType.QUADRATIC_HEXAHEDRON]
+            cell_type = pyvista.CellType.QUADRATIC_HEXAHEDRON
+        cell_types = np.full(self.n_elem, cell_type, dtype=np.uint8)
 
         # VTK element list
         el = len(self.elements[0]) * torch.ones(self.n_elem, dtype=self.elements.dtype)
-        elements = torch.cat([el[:, None], self.elements], dim=1).view(-1).tolist()
+        elements = torch.cat([el[:, None], self.elements], dim=1).view(-1).cpu().numpy()
 
         # Deformed node positions
         pos = self.nodes + u
 
         # Create unstructured mesh
-        mesh = pyvista.UnstructuredGrid(elements, cell_types, pos.tolist())
+        mesh = pyvista.UnstructuredGrid(elements, cell_types, pos.cpu().numpy())
 
         # Plot node properties
         if node_property:
@@ -123,12 +126,12 @@ class Solid(FEM):
 
         # Plot orientations
         if orientations is not None:
-            ecenters = pos[self.elements].mean(dim=1)
+            ecenters = pos[self.elements].mean(dim=1)[threshold_condition].cpu().numpy()
+            directions = orientations[threshold_condition].cpu().numpy()
             for j, color in enumerate(["red", "green", "blue"]):
-                directions = orientations[:, j, :]
                 pl.add_arrows(
-                    ecenters.numpy()[threshold_condition],
-                    directions.numpy()[threshold_condition],
+                    ecenters,
+                    directions[:, j, :],
                     mag=0.5,
                     color=color,
                     show_scalar_bar=False,
@@ -157,7 +160,9 @@ class Solid(FEM):
                 pl.add_mesh(mesh, **kwargs)
 
         if show_undeformed:
-            undefo = pyvista.UnstructuredGrid(elements, cell_types, self.nodes.tolist())
+            undefo = pyvista.UnstructuredGrid(
+                elements, cell_types, self.nodes.cpu().numpy()
+            )
             edges = (
                 undefo.separate_cells()
                 .extract_surface(nonlinear_subdivision=4)
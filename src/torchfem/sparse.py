@@ -1,6 +1,7 @@
 import pyamg
 import torch
 from scipy.sparse import coo_matrix as scipy_coo_matrix
+from scipy.sparse.linalg import cg as scipy_cg
 from scipy.sparse.linalg import minres as scipy_minres
 from scipy.sparse.linalg import spsolve as scipy_spsolve
 from torch import Tensor
@@ -11,6 +12,7 @@ try:
     import cupy
     from cupyx.scipy.sparse import coo_matrix as cupy_coo_matrix
     from cupyx.scipy.sparse import diags as cupy_diags
+    from cupyx.scipy.sparse.linalg import cg as cupy_cg
     from cupyx.scipy.sparse.linalg import minres as cupy_minres
     from cupyx.scipy.sparse.linalg import spsolve as cupy_spsolve
 
@@ -40,9 +42,13 @@ class Solve(Function):
             b = b.to(device)
 
         # Default to direct solver for small matrices
-        if direct is not None:
+        if direct is None:
             direct = shape[0] < 10000
 
+        # Default to Jacobi (GPU) or AMG (CPU) preconditioner
+        if preconditioner is None:
+            preconditioner = {"name": "jacobi"}
+
         if A.device.type == "cuda" and cupy_available:
             A_cp = cupy_coo_matrix(
                 (
@@ -61,19 +67,24 @@ class Solve(Function):
                 elif(preconditioner['name'] == 'ssor'):
                     M = ssor_preconditioner(A, omega=preconditioner['omega'], filter=preconditioner['filter'])
 
-                # Solve with minres
-                x_xp, exit_code = cupy_minres(A_cp, b_cp, M=M, tol=rtol)
+                # Solve with preconditioned conjugate gradients (K is SPD unless softening)
+                x_xp, exit_code = cupy_cg(A_cp, b_cp, M=M, tol=rtol)
+                if exit_code != 0:
+                    # Fall back to minres for indefinite (softening) tangents
+                    x_xp, exit_code = cupy_minres(A_cp, b_cp, M=M, tol=rtol)
                 if exit_code != 0:
                     raise RuntimeError(f"minres failed with exit code {exit_code}")
         else:
+            # Solve on the host (this includes CUDA tensors if CuPy is not available)
+            A = A.cpu()
             A_np = scipy_coo_matrix(
                 (A._values(), (A._indices()[0], A._indices()[1])), shape=shape
             ).tocsr()
-            b_np = b.data.numpy()
+            b_np = b.data.cpu().numpy()
             if B is None:
                 B_np = None
             else:
-                B_np = B.data.numpy()
+                B_np = B.data.cpu().numpy()
             if direct:
                 x_xp = scipy_spsolve(A_np, b_np)
             else:
@@ -84,8 +95,11 @@ class Solve(Function):
                     ml = pyamg.smoothed_aggregation_solver(A_np, B_np, smooth="jacobi")
                     M = ml.aspreconditioner()
 
-                # Solve with minres
-                x_xp, exit_code = scipy_minres(A_np, b_np, M=M, rtol=rtol)
+                # Solve with preconditioned conjugate gradients (K is SPD unless softening)
+                x_xp, exit_code = scipy_cg(A_np, b_np, M=M, rtol=rtol)
+                if exit_code != 0:
+                    # Fall back to minres for indefinite (softening) tangents
+                    x_xp, exit_code = scipy_minres(A_np, b_np, M=M, rtol=rtol)
                 if exit_code != 0:
                     raise RuntimeError(f"minres failed with exit code {exit_code}")
 
@@ -138,8 +152,10 @@ def sparse_index_select(t: Tensor, slices: list[Tensor | None]) -> Tensor:
             out_shape.append(in_shape[dim])
         else:
             out_shape.append(len(slice))
-            mask = torch.isin(indices[dim], slice)
-            cumsum = torch.cumsum(torch.isin(torch.arange(0, in_shape[dim]), slice), 0)
+            selected = torch.zeros(in_shape[dim], dtype=torch.bool, device=t.device)
+            selected[slice] = True
+            mask = selected[indices[dim]]
+            cumsum = torch.cumsum(selected, 0)
             indices = indices[:, mask]
             values = values[mask]
             indices[dim] = cumsum[indices[dim]] - 1
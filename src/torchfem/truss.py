@@ -1,5 +1,6 @@
 import matplotlib.pyplot as plt
 import torch
+from matplotlib.collections import LineCollection
 from torch import Tensor
 
 from .base import FEM
@@ -26,7 +27,6 @@ class Truss(FEM):
 
         # Set element type specific sizes
         self.n_strains = 1
-        self.n_int = len(self.etype.iweights())
 
         # Initialize external strain
         self.ext_strain = torch.zeros(self.n_elem, self.n_strains)
@@ -41,15 +41,15 @@ class Truss(FEM):
         # Cosine and sine of the element
         cs = dx / l0[:, None]
 
-        return torch.einsum("ijk,il->ijkl", B, cs).reshape(self.n_elem, -1)[:, None, :]
+        return (B[:, 0, :, None] * cs[:, None, :]).reshape(self.n_elem, 1, -1)
 
     def compute_k(self, detJ: Tensor, DCD: Tensor) -> Tensor:
         """Element stiffness matrix."""
-        return torch.einsum("j,j,jkl->jkl", self.areas, detJ, DCD)
+        return (self.areas * detJ)[:, None, None] * DCD
 
     def compute_f(self, detJ: Tensor, D: Tensor, S: Tensor) -> Tensor:
         """Element internal force vector."""
-        return torch.einsum("j,j,jkl,jk->jl", self.areas, detJ, D, S)
+        return (self.areas * detJ)[:, None] * torch.einsum("jkl,jk->jl", D, S)
 
     def plot(self, **kwargs):
         if self.n_dim == 2:
@@ -113,32 +113,46 @@ class Truss(FEM):
         size = torch.linalg.norm(pos.max() - pos.min())
 
         # Bars
-        for j, element in enumerate(self.elements):
-            n1 = element[0]
-            n2 = element[1]
-            x = [pos[n1][0], pos[n2][0]]
-            y = [pos[n1][1], pos[n2][1]]
-            ax.plot(x, y, linewidth=linewidth[j], c=color[j])
+        bars = pos[self.elements[:, :2]]
+        ax.add_collection(
+            LineCollection(
+                bars.cpu().numpy(), linewidths=linewidth.cpu().numpy(), colors=color
+            )
+        )
 
         # Forces
-        for i, force in enumerate(self.forces):
-            if torch.norm(force) > 0.0:
-                s = 0.05 * size / torch.linalg.norm(force)  # scale
-                plt.arrow(
-                    float(pos[i][0]),
-                    float(pos[i][1]),
-                    s * force[0],
-                    s * force[1],
-                    width=0.05,
-                    facecolor="gray",
-                )
+        forces = self.forces.to(pos.device)
+        norm = torch.linalg.norm(forces, dim=1)
+        mask = norm > 0.0
+        if mask.any():
+            # Arrows in data units: shaft 0.05 * size, fixed width 0.05
+            tails = pos[mask].cpu().numpy()
+            arrows = (0.05 * size + 4.5 * 0.05) * forces[mask] / norm[mask, None]
+            arrows = arrows.cpu().numpy()
+            ax.quiver(
+                tails[:, 0],
+                tails[:, 1],
+                arrows[:, 0],
+                arrows[:, 1],
+                angles="xy",
+                scale_units="xy",
+                scale=1.0,
+                units="xy",
+                width=0.05,
+                headwidth=3.0,
+                headlength=4.5,
+                headaxislength=4.5,
+                facecolor="gray",
+                edgecolor="black",
+                linewidth=1.0,
+            )
 
         # Constraints
-        for i, constraint in enumerate(self.constraints):
-            if constraint[0]:
-                ax.plot(pos[i][0] - 0.1, pos[i][1], ">", color="gray")
-            if constraint[1]:
-                ax.plot(pos[i][0], pos[i][1] - 0.1, "^", color="gray")
+        constraints = self.constraints.to(pos.device)
+        con_x = constraints[:, 0]
+        con_y = constraints[:, 1]
+        ax.plot(pos[con_x, 0] - 0.1, pos[con_x, 1], ">", color="gray")
+        ax.plot(pos[con_y, 0], pos[con_y, 1] - 0.1, "^", color="gray")
 
         # Adjustments
         nmin = pos.min(dim=0).values
@@ -183,39 +197,38 @@ class Truss(FEM):
         # Radii
         radii = torch.sqrt(self.areas / torch.pi)
 
-        # Elements
-        for j, element in enumerate(self.elements):
-            n1 = element[0]
-            n2 = element[1]
-            tube = pyvista.Tube(pos[n1], pos[n2], radius=radii[j])
-            if element_property is not None:
-                for key, value in element_property.items():
-                    value = element_property[key].squeeze()
-                    tube.cell_data[key] = value[j]
-                pl.add_mesh(tube, scalars=key, cmap=cmap)
-            else:
-                pl.add_mesh(tube, color="gray")
+        # Elements as line cells with separate end points to allow per-bar radii
+        ends = pos[self.elements[:, :2]].reshape(-1, 3)
+        lines = torch.arange(2 * self.n_elem).reshape(-1, 2)
+        cells = torch.cat([torch.full((self.n_elem, 1), 2), lines], dim=1)
+        bars = pyvista.PolyData(ends.cpu().numpy(), lines=cells.ravel().cpu().numpy())
+        bars.point_data["radius"] = radii.repeat_interleave(2).cpu().numpy()
+        if element_property is not None:
+            for key, value in element_property.items():
+                bars.cell_data[key] = value.reshape(-1).cpu().numpy()
+        tubes = bars.tube(scalars="radius", absolute=True, capping=False, n_sides=15)
+        if element_property is not None:
+            pl.add_mesh(tubes, scalars=key, cmap=cmap)
+        else:
+            pl.add_mesh(tubes, color="gray")
 
         # Forces
-        force_centers = []
-        force_directions = []
-        for i, force in enumerate(self.forces):
-            if torch.norm(force) > 0.0:
-                force_centers.append(pos[i])
-                force_directions.append(force / torch.linalg.norm(force))
-        pl.add_arrows(
-            torch.stack(force_centers).numpy(),
-            torch.stack(force_directions).numpy(),
-            mag=force_size_factor * size,
-            color="gray",
-        )
+        norm = torch.linalg.norm(self.forces, dim=1)
+        mask = norm > 0.0
+        if mask.any():
+            pl.add_arrows(
+                pos[mask].cpu().numpy(),
+                (self.forces[mask] / norm[mask, None]).cpu().numpy(),
+                mag=force_size_factor * size,
+                color="gray",
+            )
 
         # Constraints
-        for i, constraint in enumerate(self.constraints):
-            if constraint.any():
-                sphere = pyvista.Sphere(
-                    radius=constraint_size_factor * size, center=pos[i].numpy()
-                )
-                pl.add_mesh(sphere, color="gray")
+        mask = self.constraints.any(dim=1)
+        if mask.any():
+            centers = pyvista.PolyData(pos[mask].cpu().numpy())
+            sphere = pyvista.Sphere(radius=constraint_size_factor * size)
+            spheres = centers.glyph(geom=sphere, scale=False, orient=False)
+            pl.add_mesh(spheres, color="gray")
 
         pl.show(jupyter_backend="html")
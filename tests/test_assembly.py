@@ -0,0 +1,96 @@
+import pytest
+import torch
+
+from torchfem import Planar, Solid, Truss
+from torchfem.materials import (
+    IsotropicElasticity1D,
+    IsotropicElasticity3D,
+    IsotropicElasticityPlaneStress,
+)
+from torchfem.mesh import cube_hexa
+
+# Two quads sharing an edge
+quad_nodes = torch.tensor(
+    [[0.0, 0.0], [1.0, 0.0], [2.0, 0.0], [0.0, 1.0], [1.0, 1.0], [2.0, 1.0]]
+)
+quad_elements = torch.tensor([[0, 1, 4, 3], [1, 2, 5, 4]])
+planar = Planar(quad_nodes, quad_elements, IsotropicElasticityPlaneStress(1.0, 0.3))
+
+# Spatial truss with an unconnected node
+truss_nodes = torch.tensor(
+    [
+        [0.0, 0.0, 0.0],
+        [1.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0],
+        [0.0, 0.0, 1.0],
+        [2.0, 2.0, 2.0],
+    ]
+)
+truss_elements = torch.tensor([[0, 1], [0, 2], [0, 3], [1, 2], [2, 3]])
+truss = Truss(truss_nodes, truss_elements, IsotropicElasticity1D(1.0))
+
+# Small hexahedral cube
+solid = Solid(*cube_hexa(4, 3, 3), IsotropicElasticity3D(1.0, 0.3))
+
+
+def dense_stiffness(model, k, con):
+    K = torch.zeros(model.n_dofs, model.n_dofs, dtype=k.dtype)
+    for idx, k_e in zip(model.idx, k):
+        K[idx[:, None], idx[None, :]] += k_e
+    K[con, :] = 0.0
+    K[:, con] = 0.0
+    K[con, con] = 1.0
+    return K
+
+
+@pytest.mark.parametrize("model", [planar, truss, solid])
+@pytest.mark.parametrize("chunks", [1, 4, 100])
+def test_assemble_stiffness(model, chunks):
+    torch.manual_seed(0)
+    n = model.idx.shape[1]
+    k = torch.rand(model.n_elem, n, n, dtype=torch.float64)
+    con = torch.nonzero(torch.rand(model.n_dofs) < 0.2).ravel()
+
+    pattern = model.stiffness_pattern(con, chunks)
+    K = model.assemble_stiffness(k, con, pattern)
+    assert K.is_coalesced()
+    assert torch.allclose(K.to_dense(), dense_stiffness(model, k, con))
+
+    # Reassembly with the same pattern
+    k = torch.rand_like(k)
+    K = model.assemble_stiffness(k, con, pattern)
+    assert torch.allclose(K.to_dense(), dense_stiffness(model, k, con))
+
+
+def test_pattern_reuse(monkeypatch):
+    nodes, elements = cube_hexa(3, 3, 3)
+    model = Solid(nodes, elements, IsotropicElasticity3D(1000.0, 0.3))
+    model.constraints[nodes[:, 0] == 0.0] = True
+    model.forces[nodes[:, 0] == 1.0, 2] = -1.0
+
+    # Count pattern computations
+    calls = []
+    stiffness_pattern = model.stiffness_pattern
+
+    def pattern(con):
+        calls.append(con)
+        return stiffness_pattern(con)
+
+    monkeypatch.setattr(model, "stiffness_pattern", pattern)
+
+    u1 = model.solve(rtol=1e-5)[0]
+    u2 = model.solve(rtol=1e-5)[0]
+    assert len(calls) == 1
+    assert torch.equal(u1, u2)
+
+    # In-place modification of constraints invalidates the pattern
+    model.constraints[nodes[:, 0] == 1.0, 0] = True
+    u3 = model.solve(rtol=1e-5)[0]
+    assert len(calls) == 2
+    assert torch.all(u3[nodes[:, 0] == 1.0, 0] == 0.0)
+
+    # Same result as a model without cached pattern
+    fresh = Solid(nodes, elements, IsotropicElasticity3D(1000.0, 0.3))
+    fresh.constraints = model.constraints.clone()
+    fresh.forces = model.forces.clone()
+    assert torch.allclose(u3, fresh.solve(rtol=1e-5)[0])
@@ -0,0 +1,85 @@
+import pytest
+import torch
+
+import torchfem.sparse
+from torchfem import Shell
+from torchfem.materials import IsotropicElasticityPlaneStress
+from torchfem.sparse import sparse_index_select, sparse_solve
+
+
+def spd_matrix(n=20):
+    # Tridiagonal SPD matrix (1D Laplacian)
+    i = torch.arange(n)
+    rows = torch.cat([i, i[:-1], i[1:]])
+    cols = torch.cat([i, i[1:], i[:-1]])
+    values = torch.cat([2.0 * torch.ones(n), -torch.ones(n - 1), -torch.ones(n - 1)])
+    indices = torch.stack([rows, cols])
+    A = torch.sparse_coo_tensor(indices, values.double(), (n, n), check_invariants=True)
+    return A.coalesce()
+
+
+def test_sparse_solve_defaults():
+    A = spd_matrix()
+    b = torch.ones(A.shape[0], dtype=torch.float64)
+    x = sparse_solve(A, b)
+    assert torch.allclose(A @ x, b)
+
+
+def test_sparse_solve_iterative(monkeypatch):
+    # Record calls to the iterative solver
+    calls = []
+    scipy_cg = torchfem.sparse.scipy_cg
+
+    def cg(*args, **kwargs):
+        calls.append("cg")
+        return scipy_cg(*args, **kwargs)
+
+    monkeypatch.setattr(torchfem.sparse, "scipy_cg", cg)
+
+    A = spd_matrix()
+    b = torch.ones(A.shape[0], dtype=torch.float64)
+    x = sparse_solve(A, b, None, 1e-10, None, False)
+    assert calls == ["cg"]
+    assert torch.allclose(A @ x, b)
+
+
+def test_shell_solve():
+    X, Y = torch.meshgrid(
+        torch.linspace(0.0, 1.0, 3), torch.linspace(0.0, 1.0, 3), indexing="ij"
+    )
+    nodes = torch.stack([X.ravel(), Y.ravel(), torch.zeros(9)], dim=1)
+    elements = torch.tensor(
+        [[0, 3, 4], [4, 1, 0], [1, 4, 5], [5, 2, 1], [3, 6, 7], [7, 4, 3]]
+        + [[4, 7, 8], [8, 5, 4]]
+    )
+    shell = Shell(nodes, elements, IsotropicElasticityPlaneStress(1000.0, 0.3))
+    shell.constraints[nodes[:, 0] == 0.0] = True
+    shell.forces[nodes[:, 0] == 1.0, 2] = -1.0
+
+    u, f = shell.solve()
+    assert u.shape == (9, 6)
+    assert torch.all(u[nodes[:, 0] == 1.0, 2] < 0.0)
+    # Reactions balance the applied load
+    assert torch.isclose(f[:, 2].sum(), torch.tensor(0.0), atol=1e-4)
+
+
+@pytest.mark.parametrize(
+    "rows, cols",
+    [
+        (torch.tensor([0, 3, 4, 9]), None),
+        (None, torch.tensor([1, 2, 7])),
+        (torch.tensor([2, 5, 6, 8]), torch.tensor([0, 5, 6, 9])),
+    ],
+)
+def test_sparse_index_select(rows, cols):
+    torch.manual_seed(0)
+    t = (torch.rand(10, 10) * (torch.rand(10, 10) < 0.4)).to_sparse().coalesce()
+    selected = sparse_index_select(t, [rows, cols])
+
+    dense = t.to_dense()
+    if rows is not None:
+        dense = dense[rows]
+    if cols is not None:
+        dense = dense[:, cols]
+    assert selected.is_coalesced()
+    assert torch.equal(selected.to_dense(), dense)